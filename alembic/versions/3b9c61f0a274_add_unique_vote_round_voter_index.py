@@ -0,0 +1,35 @@
+"""Add unique index on vote (decision_round_id, voter_ip)
+
+Revision ID: 3b9c61f0a274
+Revises: c4e7f6b2d910
+Create Date: 2025-07-18 10:04:51.317265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9c61f0a274'
+down_revision: Union[str, Sequence[str], None] = 'c4e7f6b2d910'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backs the submit_vote idempotency check with an index lookup and
+    # enforces one vote per voter per round at the database layer.
+    op.create_index(
+        'ix_vote_round_voter',
+        'vote',
+        ['decision_round_id', 'voter_ip'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vote_round_voter', table_name='vote')
@@ -0,0 +1,31 @@
+"""Add normalized option_keys column to decisionround
+
+Revision ID: 8f20d1c4ab57
+Revises: 3b9c61f0a274
+Create Date: 2025-07-21 09:32:08.664412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f20d1c4ab57'
+down_revision: Union[str, Sequence[str], None] = '3b9c61f0a274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Normalized at write time so submit_vote reads a flat list instead of
+    # re-deriving keys from the options JSON shape per request. Existing
+    # rows stay NULL; the API derives keys on the fly for those.
+    op.add_column('decisionround', sa.Column('option_keys', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('decisionround', 'option_keys')
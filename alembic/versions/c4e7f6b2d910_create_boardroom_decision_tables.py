@@ -0,0 +1,73 @@
+"""Create decision, decisionround and vote tables
+
+Revision ID: c4e7f6b2d910
+Revises: 785aae47787c
+Create Date: 2026-08-30 13:58:02.114237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7f6b2d910'
+down_revision: Union[str, Sequence[str], None] = '785aae47787c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backing tables for app.models.boardroom; nothing created them before,
+    # so the two follow-up revisions (unique vote index, option_keys column)
+    # had no table to target. option_keys and ix_vote_round_voter are
+    # intentionally absent here: they are added by their own revisions.
+    op.create_table(
+        'decision',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('overall_status', sa.String(length=50), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'decisionround',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('decision_id', sa.Uuid(), nullable=False),
+        sa.Column('round_number', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('options', sa.JSON(), nullable=True),
+        sa.Column('opens_at', sa.DateTime(), nullable=False),
+        sa.Column('closes_at', sa.DateTime(), nullable=True),
+        sa.Column('round_status', sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(['decision_id'], ['decision.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_decisionround_decision_id', 'decisionround', ['decision_id'])
+    op.create_table(
+        'vote',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('decision_round_id', sa.Uuid(), nullable=False),
+        sa.Column('voter_ip', sa.String(length=45), nullable=False),
+        sa.Column('selected_option_key', sa.String(length=50), nullable=False),
+        sa.Column('voted_at', sa.DateTime(), nullable=False),
+        sa.Column('rationale', sa.String(length=1000), nullable=True),
+        sa.ForeignKeyConstraint(['decision_round_id'], ['decisionround.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_vote_decision_round_id', 'vote', ['decision_round_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vote_decision_round_id', table_name='vote')
+    op.drop_table('vote')
+    op.drop_index('ix_decisionround_decision_id', table_name='decisionround')
+    op.drop_table('decisionround')
+    op.drop_table('decision')
@@ -1,16 +1,16 @@
 """AI Operations monitoring and management endpoints."""
 
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api.v1.auth import get_current_session
 from app.core.limiter import limiter
 from app.core.logging import logger
 from app.core.config import settings
-from app.core.api_standards import create_standard_response, create_error_response
+from app.core.api_standards import create_standard_response, create_light_response, create_service_error_response
 from app.core.metrics import (
     ai_operations_total,
     ai_token_usage_total,
@@ -25,13 +25,39 @@ from app.schemas.ai_operations import (
     AIOperationStatus,
 )
 from app.services.ai_state_manager import ai_state_manager
-from app.core.langgraph.graph import LangGraphAgent
 
 router = APIRouter()
-agent = LangGraphAgent()
 
+# The health payload tolerates ~10s of staleness and is polled up to the
+# rate limit by every client, so one computed result is shared in-process.
+_HEALTH_CACHE_TTL_SECONDS = 10.0
+_health_cache_payload: Optional[Dict[str, Any]] = None
+_health_cache_expires = 0.0
 
-@router.get("/health")
+# Static metrics summary structure, built once at import time. Per-request
+# work is limited to stamping the timestamp; the real values would be
+# filled in from the metrics store in production.
+_METRICS_SUMMARY_TEMPLATE: Dict[str, Any] = {
+    "operations": {
+        "total_chat_requests": 0,  # Would come from metrics
+        "total_stream_requests": 0,
+        "total_tool_executions": 0,
+        "success_rate": 0.95,  # Would be calculated
+    },
+    "performance": {
+        "average_response_time_seconds": 2.5,  # Would come from metrics
+        "average_tokens_per_request": 150,
+        "peak_concurrent_sessions": 10,
+    },
+    "errors": {
+        "llm_errors_last_hour": 0,
+        "tool_errors_last_hour": 0,
+        "total_errors_last_24h": 0,
+    },
+}
+
+
+@router.get("/health", response_class=ORJSONResponse)
 @limiter.limit("20 per minute")
 async def get_ai_health(
     request: Request,
@@ -42,12 +68,22 @@ async def get_ai_health(
     Returns comprehensive health information for AI operations including
     model availability, performance metrics, and system status.
     """
+    global _health_cache_payload, _health_cache_expires
+
     try:
+        # Serve the recently computed payload if it is still fresh
+        if _health_cache_payload is not None and time.monotonic() < _health_cache_expires:
+            return create_light_response(
+                data=_health_cache_payload,
+                message="AI operations health status retrieved successfully"
+            )
+
         # Get active sessions
         active_sessions = await ai_state_manager.get_active_sessions()
-        
-        # Calculate basic metrics (in production, these would come from actual metrics store)
-        health_check = AIHealthCheck(
+
+        # Calculate basic metrics (in production, these would come from actual metrics store).
+        # Every field is assembled server-side, so skip the validation pass.
+        health_check = AIHealthCheck.model_construct(
             status="healthy",
             models_available=[settings.LLM_MODEL],
             models_unavailable=[],
@@ -60,18 +96,21 @@ async def get_ai_health(
         if len(active_sessions) > 100:  # Example threshold
             health_check.status = "degraded"
         
-        logger.info("ai_health_check_requested", 
+        logger.info("ai_health_check_requested",
                    session_id=session.id,
                    active_sessions=len(active_sessions))
-        
-        return create_standard_response(
-            data=health_check.model_dump(),
+
+        _health_cache_payload = health_check.model_dump(mode="json")
+        _health_cache_expires = time.monotonic() + _HEALTH_CACHE_TTL_SECONDS
+
+        return create_light_response(
+            data=_health_cache_payload,
             message="AI operations health status retrieved successfully"
         )
         
     except Exception as e:
-        logger.error("ai_health_check_failed", session_id=session.id, error=str(e), exc_info=True)
-        return create_error_response(
+        logger.error("ai_health_check_failed", session_id=session.id, error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to retrieve AI health status",
             error_type="health_check_error",
             details={"session_id": session.id},
@@ -79,7 +118,7 @@ async def get_ai_health(
         )
 
 
-@router.get("/sessions/active")
+@router.get("/sessions/active", response_class=ORJSONResponse)
 @limiter.limit("10 per minute")
 async def get_active_sessions(
     request: Request,
@@ -97,7 +136,7 @@ async def get_active_sessions(
                    session_id=session.id,
                    active_count=len(active_sessions))
         
-        return create_standard_response(
+        return create_light_response(
             data={
                 "active_sessions": active_sessions,
                 "total_count": len(active_sessions),
@@ -107,8 +146,8 @@ async def get_active_sessions(
         )
         
     except Exception as e:
-        logger.error("active_sessions_retrieval_failed", session_id=session.id, error=str(e), exc_info=True)
-        return create_error_response(
+        logger.error("active_sessions_retrieval_failed", session_id=session.id, error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to retrieve active sessions",
             error_type="session_retrieval_error",
             details={"session_id": session.id},
@@ -152,9 +191,8 @@ async def create_session_checkpoint(
         logger.error("session_checkpoint_failed", 
                     session_id=session.id,
                     target_session=target_session_id,
-                    error=str(e), 
-                    exc_info=True)
-        return create_error_response(
+                    error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to create session checkpoint",
             error_type="checkpoint_error",
             details={"session_id": session.id, "target_session": target_session_id},
@@ -204,9 +242,8 @@ async def restore_session_checkpoint(
                     session_id=session.id,
                     target_session=target_session_id,
                     checkpoint_id=checkpoint_id,
-                    error=str(e), 
-                    exc_info=True)
-        return create_error_response(
+                    error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to restore session from checkpoint",
             error_type="restore_error",
             details={
@@ -250,9 +287,8 @@ async def cleanup_expired_sessions(
     except Exception as e:
         logger.error("session_cleanup_failed", 
                     session_id=session.id,
-                    error=str(e), 
-                    exc_info=True)
-        return create_error_response(
+                    error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to clean up expired sessions",
             error_type="cleanup_error",
             details={"session_id": session.id},
@@ -260,7 +296,7 @@ async def cleanup_expired_sessions(
         )
 
 
-@router.get("/metrics/summary")
+@router.get("/metrics/summary", response_class=ORJSONResponse)
 @limiter.limit("10 per minute")
 async def get_ai_metrics_summary(
     request: Request,
@@ -272,38 +308,18 @@ async def get_ai_metrics_summary(
     performance data, and error rates.
     """
     try:
-        # In a production environment, these would be retrieved from the metrics store
-        # For now, we return a basic summary structure
-        metrics_summary = {
-            "operations": {
-                "total_chat_requests": 0,  # Would come from metrics
-                "total_stream_requests": 0,
-                "total_tool_executions": 0,
-                "success_rate": 0.95,  # Would be calculated
-            },
-            "performance": {
-                "average_response_time_seconds": 2.5,  # Would come from metrics
-                "average_tokens_per_request": 150,
-                "peak_concurrent_sessions": 10,
-            },
-            "errors": {
-                "llm_errors_last_hour": 0,
-                "tool_errors_last_hour": 0,
-                "total_errors_last_24h": 0,
-            },
-            "timestamp": time.time()
-        }
-        
-        logger.info("ai_metrics_summary_requested", session_id=session.id)
-        
-        return create_standard_response(
+        metrics_summary = {**_METRICS_SUMMARY_TEMPLATE, "timestamp": time.time()}
+
+        logger.debug("ai_metrics_summary_requested", session_id=session.id)
+
+        return create_light_response(
             data=metrics_summary,
             message="AI metrics summary retrieved successfully"
         )
         
     except Exception as e:
-        logger.error("ai_metrics_summary_failed", session_id=session.id, error=str(e), exc_info=True)
-        return create_error_response(
+        logger.error("ai_metrics_summary_failed", session_id=session.id, error_type=type(e).__name__, error=str(e)[:200])
+        return create_service_error_response(
             message="Failed to retrieve AI metrics summary",
             error_type="metrics_error",
             details={"session_id": session.id},
@@ -4,19 +4,23 @@ This module sets up the main API router and includes all sub-routers for differe
 endpoints like authentication and chatbot functionality.
 """
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.chatbot import router as chatbot_router
 from app.api.v1.standards import router as standards_router
-from app.api.v1.boardroom import router as boardroom_router
 from app.api.v1.endpoints.decisions import router as decisions_router
 from app.api.v1.endpoints.events import router as events_router
 from app.api.v1.ai_operations import router as ai_operations_router
 from app.api.v1.cache import router as cache_router
+from app.core.config import settings
 from app.core.logging import logger
 
-api_router = APIRouter()
+# orjson encodes the nested payloads these routers return several times
+# faster than the stdlib JSONResponse default.
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include routers with proper tags and descriptions
 api_router.include_router(
@@ -39,15 +43,22 @@ api_router.include_router(
     }
 )
 
-api_router.include_router(
-    boardroom_router,
-    prefix="/boardroom",
-    tags=["Boardroom & Decisions"],
-    responses={
-        404: {"description": "Resource not found"},
-        422: {"description": "Validation error"}
-    }
-)
+# The boardroom router is feature-flagged; importing it lazily here means a
+# disabled deployment never loads the module or registers its routes.
+if settings.BOARDROOM_ENABLED:
+    from app.api.v1.boardroom import router as boardroom_router
+
+    api_router.include_router(
+        boardroom_router,
+        prefix="/boardroom",
+        tags=["Boardroom & Decisions"],
+        responses={
+            404: {"description": "Resource not found"},
+            422: {"description": "Validation error"}
+        }
+    )
+else:
+    logger.info("boardroom_router_disabled")
 
 api_router.include_router(
     decisions_router,
@@ -99,6 +110,11 @@ api_router.include_router(
 )
 
 
+# The liveness payload never varies, so it is encoded once at import; the
+# handler just hands the same bytes back.
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": "1.0.0"})
+
+
 @api_router.get("/health", tags=["Health & Status"])
 async def health_check():
     """Health check endpoint.
@@ -107,4 +123,4 @@ async def health_check():
         dict: Health status information.
     """
     logger.info("health_check_called")
-    return {"status": "healthy", "version": "1.0.0"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,4 +1,6 @@
+import ipaddress
 import uuid
+from datetime import datetime
 from typing import List
 
 from app.models.boardroom import (
@@ -17,38 +19,93 @@ from app.schemas.boardroom import (
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.core.logging import logger
-from app.utils.sanitization import (
-    sanitize_string,
-    validate_ip_address,
-    validate_uuid_string,
-)
+from app.services.redis_service import redis_service
+from app.utils.sanitization import sanitize_string
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
     Request,
+    Response,
 )
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 router = APIRouter()
 
+# Round option keys are immutable once a round opens, so they are cached in
+# Redis until the round closes to spare submit_vote a DB round-trip per vote.
+ROUND_OPTIONS_KEY = "round_opts:{}".format
+DEFAULT_ROUND_OPTIONS_TTL = 3600
+
+
+def _extract_option_keys(options) -> List[str] | None:
+    """Extract the valid option keys from a round's options payload.
+
+    Returns None if the options structure is neither a dict nor a list of
+    keyed dicts.
+    """
+    if isinstance(options, dict):
+        return list(options.keys())
+    if isinstance(options, list):
+        return [
+            opt.get("key") for opt in options
+            if isinstance(opt, dict) and "key" in opt
+        ]
+    return None
+
+
+# The vote INSERT is the hottest statement in this module; building it once
+# with bind parameters keeps per-request work to parameter binding only and
+# lets asyncpg reuse its prepared-statement cache for the compiled SQL.
+# One Rust-core pass validates the ORM rows and one dumps them to JSON
+# bytes, replacing FastAPI's per-element field walk plus encoder pass on
+# the list endpoint.
+DECISION_LIST_ADAPTER = TypeAdapter(List[DecisionSchema])
+
+VOTE_INSERT_STMT = (
+    pg_insert(Vote)
+    .values(
+        decision_round_id=bindparam("decision_round_id"),
+        voter_ip=bindparam("voter_ip"),
+        selected_option_key=bindparam("selected_option_key"),
+        rationale=bindparam("rationale"),
+    )
+    .on_conflict_do_nothing(index_elements=["decision_round_id", "voter_ip"])
+    .returning(Vote.id)
+)
+
+
+def _round_options_ttl(closes_at) -> int:
+    """TTL for a round's cached option keys: until close, with a floor."""
+    if closes_at is None:
+        return DEFAULT_ROUND_OPTIONS_TTL
+    remaining = (closes_at - datetime.now(closes_at.tzinfo)).total_seconds()
+    return max(int(remaining), 60)
+
 
 @router.post("/decisions", response_model=DecisionSchema, status_code=201)
 @limiter.limit("10 per minute")
-def create_decision(request: Request, decision_in: DecisionCreate, db: Session = Depends(get_db)):
+async def create_decision(request: Request, decision_in: DecisionCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new decision and its initial voting round.
     """
     try:
         logger.info("create_decision_request", title=decision_in.title[:50])
-        
+
         # Create the main decision object
         db_decision = Decision(
             title=decision_in.title,
             description=decision_in.description,
         )
         db.add(db_decision)
-        db.flush()  # Flush to get the generated decision ID
+        # No flush needed: ids are generated client-side by the model's
+        # default_factory, so the round can reference the decision directly
+        # and both INSERTs go out in the single flush at commit.
 
         # Create the initial round for this decision
         initial_round = decision_in.initial_round
@@ -58,56 +115,77 @@ def create_decision(request: Request, decision_in: DecisionCreate, db: Session =
             title=initial_round.title or db_decision.title, # Default to decision title
             description=initial_round.description or db_decision.description, # Default to decision desc
             options=initial_round.options,
+            option_keys=_extract_option_keys(initial_round.options),
             opens_at=initial_round.opens_at,
             closes_at=initial_round.closes_at,
         )
+        # Attach in memory so serializing the response doesn't trigger a
+        # lazy load (which would fail outside a sync session context).
+        db_round.votes = []
+        db_decision.rounds.append(db_round)
         db.add(db_round)
-        db.commit()
-        db.refresh(db_decision)
-        
+        await db.commit()
+
+        # Warm the option-key cache so votes never pay the round lookup
+        option_keys = db_round.option_keys
+        if option_keys is not None:
+            await redis_service.set(
+                ROUND_OPTIONS_KEY(db_round.id),
+                option_keys,
+                ttl=_round_options_ttl(db_round.closes_at),
+            )
+
         logger.info("decision_created", decision_id=str(db_decision.id))
         return db_decision
-        
+
     except ValueError as ve:
-        logger.error("decision_creation_validation_failed", error=str(ve), exc_info=True)
+        logger.error("decision_creation_validation_failed", error_type=type(ve).__name__, error=str(ve)[:200])
         raise HTTPException(status_code=422, detail=str(ve))
     except Exception as e:
-        logger.error("decision_creation_failed", error=str(e), exc_info=True)
-        db.rollback()
+        logger.error("decision_creation_failed", error_type=type(e).__name__, error=str(e)[:200])
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to create decision")
 
 
-@router.get("/decisions", response_model=List[DecisionSchema])
+@router.get("/decisions", response_model=List[DecisionSchema], response_class=ORJSONResponse)
 @limiter.limit("50 per minute")
-def list_decisions(request: Request, db: Session = Depends(get_db)):
+async def list_decisions(request: Request, db: AsyncSession = Depends(get_db)):
     """
     List all decisions.
     """
     try:
-        decisions = db.query(Decision).options(
-            joinedload(Decision.rounds).joinedload(DecisionRound.votes)
-        ).all()
+        # selectinload issues one IN-list query per collection instead of a
+        # joined Cartesian product (decisions x rounds x votes).
+        result = await db.execute(
+            select(Decision).options(
+                selectinload(Decision.rounds).selectinload(DecisionRound.votes)
+            )
+        )
+        decisions = result.scalars().all()
         logger.info("decisions_listed", count=len(decisions))
-        return decisions
+        payload = DECISION_LIST_ADAPTER.dump_json(
+            DECISION_LIST_ADAPTER.validate_python(decisions, from_attributes=True)
+        )
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
-        logger.error("list_decisions_failed", error=str(e), exc_info=True)
+        logger.error("list_decisions_failed", error_type=type(e).__name__, error=str(e)[:200])
         raise HTTPException(status_code=500, detail="Failed to retrieve decisions")
 
 
 @router.get("/decisions/{decision_id}", response_model=DecisionSchema)
 @limiter.limit("100 per minute")
-def get_decision(request: Request, decision_id: uuid.UUID, db: Session = Depends(get_db)):
+async def get_decision(request: Request, decision_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """
     Get a single decision by its ID, including all rounds and votes.
     """
     try:
-        # Validate UUID
-        validate_uuid_string(str(decision_id))
-        
-        decision = db.query(Decision).options(
-            joinedload(Decision.rounds).joinedload(DecisionRound.votes)
-        ).filter(Decision.id == decision_id).first()
-        
+        result = await db.execute(
+            select(Decision).options(
+                selectinload(Decision.rounds).selectinload(DecisionRound.votes)
+            ).where(Decision.id == decision_id)
+        )
+        decision = result.scalars().first()
+
         if not decision:
             logger.warning("decision_not_found", decision_id=str(decision_id))
             raise HTTPException(status_code=404, detail="Decision not found")
@@ -116,54 +194,60 @@ def get_decision(request: Request, decision_id: uuid.UUID, db: Session = Depends
         return decision
         
     except ValueError as ve:
-        logger.error("get_decision_validation_failed", error=str(ve), decision_id=str(decision_id), exc_info=True)
+        logger.error("get_decision_validation_failed", error_type=type(ve).__name__, error=str(ve)[:200], decision_id=str(decision_id))
         raise HTTPException(status_code=422, detail=str(ve))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("get_decision_failed", error=str(e), decision_id=str(decision_id), exc_info=True)
+        logger.error("get_decision_failed", error_type=type(e).__name__, error=str(e)[:200], decision_id=str(decision_id))
         raise HTTPException(status_code=500, detail="Failed to retrieve decision")
 
 
 @router.post("/rounds/{round_id}/vote", status_code=201)
 @limiter.limit("20 per minute")
-def submit_vote(
+async def submit_vote(
     request: Request,
     round_id: uuid.UUID,
     vote_in: VoteCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a vote for a specific decision round.
     """
     try:
-        # Validate UUID
-        validate_uuid_string(str(round_id))
-        
-        # Get client IP and validate
-        voter_ip = request.client.host if request.client else "unknown"
-        if voter_ip != "unknown":
-            validate_ip_address(voter_ip)
-        
-        logger.info("vote_submission_attempt", round_id=str(round_id), voter_ip=voter_ip)
-        
-        db_round = db.query(DecisionRound).filter(DecisionRound.id == round_id).first()
-        if not db_round:
-            logger.warning("round_not_found_for_vote", round_id=str(round_id))
-            raise HTTPException(status_code=404, detail="Decision round not found")
-
-        # Enhanced validation: check if the selected option is valid for this round
-        if isinstance(db_round.options, dict):
-            valid_option_keys = list(db_round.options.keys())
-        elif isinstance(db_round.options, list):
-            valid_option_keys = [
-                opt.get("key") for opt in db_round.options
-                if isinstance(opt, dict) and "key" in opt
-            ]
+        # Parse and normalize the client address in one step; ip_address()
+        # raises ValueError on bad input, which maps to the 422 handler below.
+        if request.client:
+            voter_ip = ipaddress.ip_address(request.client.host).compressed
         else:
-            logger.error("invalid_round_options_format", round_id=str(round_id), options_type=type(db_round.options))
-            raise HTTPException(status_code=500, detail="Invalid round options format")
+            voter_ip = "unknown"
+
+        logger.info("vote_submission_attempt", round_id=str(round_id), voter_ip=voter_ip)
         
+        # Option keys are cached per round; only hit the database on a miss.
+        valid_option_keys = await redis_service.get(ROUND_OPTIONS_KEY(round_id))
+        if valid_option_keys is None:
+            result = await db.execute(
+                select(DecisionRound).where(DecisionRound.id == round_id)
+            )
+            db_round = result.scalars().first()
+            if not db_round:
+                logger.warning("round_not_found_for_vote", round_id=str(round_id))
+                raise HTTPException(status_code=404, detail="Decision round not found")
+
+            # Rounds written before option_keys existed derive it on the fly
+            valid_option_keys = db_round.option_keys or _extract_option_keys(db_round.options)
+            if valid_option_keys is None:
+                logger.error("invalid_round_options_format", round_id=str(round_id), options_type=type(db_round.options))
+                raise HTTPException(status_code=500, detail="Invalid round options format")
+
+            # Backfill the cache for subsequent votes in this round
+            await redis_service.set(
+                ROUND_OPTIONS_KEY(round_id),
+                valid_option_keys,
+                ttl=_round_options_ttl(db_round.closes_at),
+            )
+
         if vote_in.selected_option_key not in valid_option_keys:
             logger.warning(
                 "invalid_vote_option",
@@ -176,25 +260,23 @@ def submit_vote(
                 detail=f"Invalid option '{vote_in.selected_option_key}'. Valid options are: {valid_option_keys}"
             )
 
-        # Check for existing vote (for idempotency)
-        existing_vote = db.query(Vote).filter(
-            Vote.decision_round_id == round_id,
-            Vote.voter_ip == voter_ip
-        ).first()
-
-        if existing_vote:
+        # Insert and detect duplicates in a single statement: the unique
+        # (decision_round_id, voter_ip) index enforces one vote per voter,
+        # so the separate check-then-insert (and its race window) is gone.
+        result = await db.execute(
+            VOTE_INSERT_STMT,
+            {
+                "decision_round_id": round_id,
+                "voter_ip": voter_ip,
+                "selected_option_key": vote_in.selected_option_key,
+                "rationale": vote_in.rationale,
+            },
+        )
+        vote_id = result.scalar()
+        if vote_id is None:
             logger.warning("duplicate_vote_attempt", round_id=str(round_id), voter_ip=voter_ip)
             raise HTTPException(status_code=409, detail="You have already voted in this round.")
-
-        # Create the vote
-        db_vote = Vote(
-            decision_round_id=round_id,
-            voter_ip=voter_ip,
-            selected_option_key=vote_in.selected_option_key,
-            rationale=vote_in.rationale,
-        )
-        db.add(db_vote)
-        db.commit()
+        await db.commit()
 
         logger.info(
             "vote_recorded",
@@ -202,15 +284,15 @@ def submit_vote(
             voter_ip=voter_ip,
             selected_option=vote_in.selected_option_key
         )
-        
-        return {"status": "vote recorded", "vote_id": str(db_vote.id)}
+
+        return {"status": "vote recorded", "vote_id": str(vote_id)}
         
     except ValueError as ve:
-        logger.error("vote_validation_failed", error=str(ve), round_id=str(round_id), exc_info=True)
+        logger.error("vote_validation_failed", error_type=type(ve).__name__, error=str(ve)[:200], round_id=str(round_id))
         raise HTTPException(status_code=422, detail=str(ve))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("vote_submission_failed", error=str(e), round_id=str(round_id), exc_info=True)
-        db.rollback()
+        logger.error("vote_submission_failed", error_type=type(e).__name__, error=str(e)[:200], round_id=str(round_id))
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to submit vote")
\ No newline at end of file
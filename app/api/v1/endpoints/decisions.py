@@ -1,6 +1,6 @@
 import asyncio
 import uuid # Added for UUID type hinting
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any, Optional # Added Optional
 
@@ -14,7 +14,7 @@ from app.schemas.decision import (
     VoteRead
 )
 from app.services.database import database_service # Using global instance
-from app.core.langgraph.boardroom import create_boardroom_workflow, BoardroomGraphState, decision_event_queues
+from app.core.langgraph.boardroom import create_boardroom_workflow, BoardroomGraphState
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.core.logging import logger
@@ -42,6 +42,54 @@ else:
         pg_saver = None
         boardroom_app = None
 
+# Graph jobs are funnelled through one queue drained by a single consumer
+# task, instead of per-request BackgroundTasks scheduling (which holds a
+# reference to the job until the response is fully sent). A durable outbox
+# table would be the next step once the decision CRUD layer is in place.
+_graph_job_queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+_graph_worker_task: Optional[asyncio.Task] = None
+
+
+async def _drain_graph_jobs() -> None:
+    """Consume queued graph jobs sequentially until cancelled."""
+    while True:
+        config, graph_input_state_data = await _graph_job_queue.get()
+        try:
+            await run_graph_async(config, graph_input_state_data)
+        except Exception as e:
+            logger.error(f"_drain_graph_jobs: Graph job failed for config {config}: {e}", exc_info=True)
+        finally:
+            _graph_job_queue.task_done()
+
+
+def enqueue_graph_job(config: Dict[str, Any], graph_input_state_data: Dict[str, Any]) -> None:
+    """Queue a graph invocation for the background consumer."""
+    global _graph_worker_task
+    if _graph_worker_task is None or _graph_worker_task.done():
+        _graph_worker_task = asyncio.create_task(_drain_graph_jobs())
+    _graph_job_queue.put_nowait((config, graph_input_state_data))
+
+
+async def shutdown_graph_worker() -> None:
+    """Stop the graph job consumer; called from the application lifespan.
+
+    Cancels the worker between jobs and logs anything still queued so a
+    graceful shutdown does not silently discard pending invocations.
+    """
+    global _graph_worker_task
+    if _graph_worker_task is not None and not _graph_worker_task.done():
+        _graph_worker_task.cancel()
+        try:
+            await _graph_worker_task
+        except asyncio.CancelledError:
+            pass
+    _graph_worker_task = None
+
+    pending = _graph_job_queue.qsize()
+    if pending:
+        logger.warning(f"shutdown_graph_worker: Discarding {pending} pending graph job(s) at shutdown.")
+
+
 async def run_graph_async(config: Dict[str, Any], graph_input_state_data: Dict[str, Any]):
     """Helper to run graph invocation."""
     if boardroom_app:
@@ -63,16 +111,28 @@ async def run_graph_async(config: Dict[str, Any], graph_input_state_data: Dict[s
                     logger.error(f"run_graph_async: current_round_id is not a valid UUID string or UUID object: {raw_current_round_id}")
                     return
             
-            graph_state_obj = BoardroomGraphState(**graph_input_state_data)
-            
-            decision_id_str_for_queue = str(graph_state_obj.decision_id) # Use string for queue key
-            if decision_id_str_for_queue not in decision_event_queues:
-                 decision_event_queues[decision_id_str_for_queue] = asyncio.Queue(maxsize=100)
-                 logger.info(f"run_graph_async: Created SSE queue for decision_id {decision_id_str_for_queue}")
-
-            logger.info(f"run_graph_async: Invoking graph with config: {config}, state: {graph_state_obj.model_dump_json(indent=2)}")
-            boardroom_app.invoke(graph_state_obj.model_dump(), config=config) # Pass the dict representation
-            logger.info(f"run_graph_async: Graph invocation completed for config: {config}")
+            # IDs were normalized to UUIDs above and the rest of the payload is
+            # built server-side, so skip the Pydantic validation pass.
+            graph_state_obj = BoardroomGraphState.model_construct(**graph_input_state_data)
+
+            # SSE fan-out goes through Redis Pub/Sub; no per-process queue
+            # needs to exist before the graph publishes.
+
+            logger.info(
+                "run_graph_async_invoking",
+                decision_id=str(graph_state_obj.decision_id),
+                current_round_id=str(graph_state_obj.current_round_id) if graph_state_obj.current_round_id else None,
+                status=graph_state_obj.status,
+            )
+            # Serializing the full state is expensive and only useful when
+            # actually debugging; skip the encode entirely otherwise.
+            if settings.DEBUG:
+                logger.debug("run_graph_async_state", state=graph_state_obj.model_dump_json())
+            # ainvoke keeps the event loop free for SSE delivery and other
+            # requests while the graph runs; the sync invoke blocked the loop
+            # for the whole execution.
+            await boardroom_app.ainvoke(graph_state_obj.model_dump(), config=config) # Pass the dict representation
+            logger.info("run_graph_async_completed", decision_id=str(graph_state_obj.decision_id))
         except Exception as e:
             logger.error(f"run_graph_async: Error invoking graph for config {config}: {e}", exc_info=True)
     else:
@@ -82,7 +142,6 @@ async def run_graph_async(config: Dict[str, Any], graph_input_state_data: Dict[s
 @router.post("/", response_model=DecisionRead)
 async def create_decision_endpoint(
     decision_data: DecisionCreate, # Schemas now use UUIDs
-    background_tasks: BackgroundTasks,
 ):
     # create_decision should now return DecisionRead (which now has UUID id)
     created_decision: DecisionRead = await database_service.create_decision(decision_data)
@@ -113,7 +172,7 @@ async def create_decision_endpoint(
             "status": "decision_created" if not initial_round_id_uuid else "pending_votes"
         }
         logger.info(f"create_decision_endpoint: Scheduling graph run for new decision_id: {created_decision.id}")
-        background_tasks.add_task(run_graph_async, config, initial_graph_state_data)
+        enqueue_graph_job(config, initial_graph_state_data)
 
     return created_decision
 
@@ -133,7 +192,6 @@ async def create_round_for_decision_endpoint(
     request: Request,
     decision_id: uuid.UUID, # Path param is now UUID
     round_data: DecisionRoundCreate, # DecisionRoundCreate.decision_id is UUID
-    background_tasks: BackgroundTasks,
 ):
     try:
         # Validate UUID format
@@ -160,7 +218,7 @@ async def create_round_for_decision_endpoint(
                 "status": "pending_votes"
             }
             logger.info(f"create_round_for_decision_endpoint: Scheduling graph update for new round {new_round.id} in decision {decision_id}")
-            background_tasks.add_task(run_graph_async, config, graph_update_state_data)
+            enqueue_graph_job(config, graph_update_state_data)
         
         logger.info("round_created_successfully", decision_id=str(decision_id), round_id=str(new_round.id))
         return new_round
@@ -181,7 +239,6 @@ async def create_vote_endpoint(
     request: Request,
     round_id: uuid.UUID, # Path param is now UUID
     vote_data: VoteCreate, # VoteCreate.round_id is UUID
-    background_tasks: BackgroundTasks,
 ):
     try:
         # Validate UUID format
@@ -222,7 +279,7 @@ async def create_vote_endpoint(
                 "status": "new_vote_cast"
             }
             logger.info(f"create_vote_endpoint: Scheduling graph run for new vote in round_id: {round_id}, decision_id: {decision_id_for_graph}")
-            background_tasks.add_task(run_graph_async, config, graph_trigger_state_data)
+            enqueue_graph_job(config, graph_trigger_state_data)
         
         logger.info("vote_created_successfully", round_id=str(round_id), vote_id=str(created_vote.id), voter_ip=voter_ip)
         return created_vote
@@ -1,72 +1,135 @@
 import asyncio
-import json
 import uuid # Added
+
+import orjson
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import StreamingResponse
 from typing import AsyncGenerator, Dict # Added Dict
 
-from app.core.langgraph.boardroom import decision_event_queues # Added
+from app.core.langgraph.boardroom import DECISION_EVENTS_CHANNEL # Added
 from app.core.logging import logger # Added
+from app.services.redis_service import redis_service
 
 router = APIRouter()
 
-async def sse_event_generator(decision_id_key: str, request: Request) -> AsyncGenerator[str, None]: # Renamed decision_id_uuid to decision_id_key
+# Constant SSE frames, encoded once; long-lived streams re-yield these
+# without re-serializing or re-encoding per event.
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+STREAM_UNAVAILABLE_FRAME = (
+    b"event: error\ndata: "
+    + orjson.dumps({"error": "Decision event stream not available or decision ID invalid."})
+    + b"\n\n"
+)
+EVENT_PROCESSING_ERROR_FRAME = (
+    b"event: error\ndata: "
+    + orjson.dumps({"error": "Error processing event from graph."})
+    + b"\n\n"
+)
+
+# Give up on a stream after this many consecutive read failures; a dead
+# pub/sub connection fails every read instantly, and without a cap the
+# loop would spin at full speed emitting error frames.
+MAX_CONSECUTIVE_FAILURES = 3
+FAILURE_BACKOFF_SECONDS = 1.0
+
+async def _watch_disconnect(request: Request) -> None:
+    """Return once the client's connection drops."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def sse_event_generator(decision_id_key: str, request: Request) -> AsyncGenerator[bytes, None]: # Renamed decision_id_uuid to decision_id_key
     """
-    Generates SSE events for a given decision_id (string key) by consuming from its queue.
+    Generates SSE events for a given decision_id (string key) by consuming its
+    Redis Pub/Sub channel. Redis is the shared bus, so events published from
+    any worker process reach this consumer.
     """
-    queue = decision_event_queues.get(decision_id_key)
-    if not queue:
-        logger.warning(f"sse_event_generator: No queue found for decision_id_key {decision_id_key} at generator start.")
-        error_event = {"error": "Decision event stream not available or decision ID invalid."}
-        yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+    pubsub = redis_service.pubsub()
+    if pubsub is None:
+        logger.warning(f"sse_event_generator: Redis unavailable for decision_id_key {decision_id_key} at generator start.")
+        yield STREAM_UNAVAILABLE_FRAME
         return
 
     logger.info(f"sse_event_generator: Starting event stream for decision_id_key {decision_id_key}")
+    # One long-lived watcher task per stream instead of polling
+    # request.is_disconnected() every iteration; asyncio.wait below wakes
+    # the instant either a message arrives or the client drops.
+    disconnect_task = asyncio.create_task(_watch_disconnect(request))
+    get_task = None
+    consecutive_failures = 0
     try:
+        await pubsub.subscribe(DECISION_EVENTS_CHANNEL(decision_id_key))
+
         # Send an initial connected event, using the decision_id_key which is str(UUID)
-        yield f"event: connected\ndata: {json.dumps({'decision_id': decision_id_key, 'status': 'monitoring_active'})}\n\n"
+        yield b"event: connected\ndata: " + orjson.dumps({"decision_id": decision_id_key, "status": "monitoring_active"}) + b"\n\n"
 
         while True:
-            if await request.is_disconnected():
+            if get_task is None:
+                get_task = asyncio.create_task(
+                    pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                )
+
+            done, _ = await asyncio.wait(
+                {get_task, disconnect_task},
+                return_when=asyncio.FIRST_COMPLETED,
+                timeout=25.0,
+            )
+            if disconnect_task in done:
                 logger.info(f"sse_event_generator: Client disconnected for decision_id_key {decision_id_key}")
                 break
-            
+            if not done:
+                yield KEEPALIVE_FRAME # Send a keep-alive comment
+                continue
+
             try:
-                graph_payload: Dict = await asyncio.wait_for(queue.get(), timeout=30.0) # Timeout to check disconnect
-                
+                message = get_task.result()
+                get_task = None
+                if message is None:
+                    continue
+
+                # Payloads are published as orjson bytes; decode only to read
+                # the event type, then pass the original bytes through.
+                raw_payload: bytes = message["data"]
+                graph_payload: Dict = orjson.loads(raw_payload)
                 event_type = graph_payload.get("status", "state_update") # Default event type
-                
-                # Ensure all UUIDs in payload are strings for JSON serialization
-                def serialize_payload(data):
-                    if isinstance(data, dict):
-                        return {k: serialize_payload(v) for k, v in data.items()}
-                    elif isinstance(data, list):
-                        return [serialize_payload(i) for i in data]
-                    elif isinstance(data, uuid.UUID):
-                        return str(data)
-                    return data
-
-                yield f"event: {event_type}\ndata: {json.dumps(serialize_payload(graph_payload))}\n\n"
-                queue.task_done()
-            except asyncio.TimeoutError:
-                yield ": keep-alive\n\n" # Send a keep-alive comment
-                continue
+
+                consecutive_failures = 0
+                yield (
+                    f"event: {event_type}\ndata: ".encode()
+                    + raw_payload
+                    + b"\n\n"
+                )
             except Exception as e:
-                logger.error(f"sse_event_generator: Error processing queue item for {decision_id_key}: {e}", exc_info=True)
-                error_event = {"error": "Error processing event from graph."}
-                yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+                logger.error(f"sse_event_generator: Error processing published event for {decision_id_key}: {e}", exc_info=True)
+                get_task = None
+                consecutive_failures += 1
+                yield EVENT_PROCESSING_ERROR_FRAME
+                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    logger.error(f"sse_event_generator: {consecutive_failures} consecutive failures for {decision_id_key}; closing stream.")
+                    break
+                # Back off so a dead pub/sub connection (which fails every
+                # read instantly) cannot busy-loop error frames.
+                await asyncio.sleep(FAILURE_BACKOFF_SECONDS)
 
     except asyncio.CancelledError:
         logger.info(f"sse_event_generator: Connection cancelled by client for decision_id_key {decision_id_key}")
     except Exception as e:
         logger.error(f"sse_event_generator: Unhandled exception for {decision_id_key}: {e}", exc_info=True)
         if not await request.is_disconnected():
-            error_payload = json.dumps({"error": "Stream error", "detail": str(e)})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = orjson.dumps({"error": "Stream error", "detail": str(e)})
+            yield b"event: error\ndata: " + error_payload + b"\n\n"
     finally:
         logger.info(f"sse_event_generator: Stream ended for decision_id_key {decision_id_key}")
-        # Note: Queue is not removed here, as it's shared per decision_id.
-        # It should be cleaned up when the decision process itself ends.
+        for task in (get_task, disconnect_task):
+            if task is not None and not task.done():
+                task.cancel()
+        try:
+            await pubsub.unsubscribe(DECISION_EVENTS_CHANNEL(decision_id_key))
+            await pubsub.close()
+        except Exception as e:
+            logger.warning(f"sse_event_generator: Failed to close pubsub for {decision_id_key}: {e}")
 
 @router.get("/events", summary="Subscribe to Boardroom Decision Events (SSE)")
 async def stream_boardroom_events(request: Request, decision_id: str): # decision_id from query is a string
@@ -84,12 +147,6 @@ async def stream_boardroom_events(request: Request, decision_id: str): # decisio
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid decision_id format. Must be a valid UUID string.")
 
-    decision_id_key = decision_id # Use the validated string UUID as the key
+    decision_id_key = decision_id # Use the validated string UUID as the channel key
 
-    if decision_id_key not in decision_event_queues:
-        logger.info(f"stream_boardroom_events: Creating new event queue for decision_id_key {decision_id_key}")
-        decision_event_queues[decision_id_key] = asyncio.Queue(maxsize=100)
-    else:
-        logger.info(f"stream_boardroom_events: Using existing event queue for decision_id_key {decision_id_key}")
-    
-    return StreamingResponse(sse_event_generator(decision_id_key, request), media_type="text/event-stream")
\ No newline at end of file
+    return StreamingResponse(sse_event_generator(decision_id_key, request), media_type="text/event-stream")
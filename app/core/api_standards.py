@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, Union
 
 from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.core.config import settings
@@ -22,6 +23,10 @@ from app.schemas.api import (
     StandardResponse,
 )
 
+# The deployment environment never changes after boot; resolve the enum
+# value once instead of per response.
+_ENVIRONMENT_VALUE = settings.ENVIRONMENT.value
+
 
 class APIStandardsMiddleware:
     """Middleware for applying API standards across all endpoints."""
@@ -40,8 +45,9 @@ class APIStandardsMiddleware:
         request_id = str(uuid.uuid4())
         request.state.request_id = request_id
         
-        # Add request timestamp
-        request.state.start_time = time.time()
+        # Monotonic integer clock: immune to wall-clock jumps and avoids a
+        # float allocation per read compared to time.time().
+        request.state.start_time = time.perf_counter_ns()
         
         # Log request
         logger.info(
@@ -59,7 +65,7 @@ class APIStandardsMiddleware:
                 headers.update({
                     b"x-request-id": request_id.encode(),
                     b"x-api-version": settings.VERSION.encode(),
-                    b"x-response-time": str(int((time.time() - request.state.start_time) * 1000)).encode(),
+                    b"x-response-time": str((time.perf_counter_ns() - request.state.start_time) // 1_000_000).encode(),
                 })
                 message["headers"] = [(k.encode() if isinstance(k, str) else k, 
                                      v.encode() if isinstance(v, str) else v) 
@@ -95,7 +101,7 @@ def create_standard_response(
         timestamp=datetime.now(),
         request_id=request_id or str(uuid.uuid4()),
         version=settings.VERSION,
-        environment=settings.ENVIRONMENT.value
+        environment=_ENVIRONMENT_VALUE
     )
     
     response = StandardResponse(
@@ -110,6 +116,27 @@ def create_standard_response(
     return response.model_dump(exclude_none=True)
 
 
+def create_light_response(
+    data: Any = None,
+    message: str = "Request processed successfully"
+) -> Dict[str, Any]:
+    """Create a minimal success envelope for hot read endpoints.
+
+    Skips the metadata block that create_standard_response builds per call
+    (two pydantic models, a uuid4 and a model_dump). Use it where callers
+    only need success/data/message; request tracing is already provided by
+    the middleware headers.
+
+    Args:
+        data: The response data
+        message: Human-readable message
+
+    Returns:
+        Minimal response dictionary
+    """
+    return {"success": True, "data": data, "message": message}
+
+
 def create_error_response(
     code: str,
     message: str,
@@ -137,7 +164,7 @@ def create_error_response(
         timestamp=datetime.now(),
         request_id=request_id or str(uuid.uuid4()),
         version=settings.VERSION,
-        environment=settings.ENVIRONMENT.value
+        environment=_ENVIRONMENT_VALUE
     )
     
     error = ErrorDetail(
@@ -156,6 +183,38 @@ def create_error_response(
     return response.model_dump(exclude_none=True)
 
 
+def create_service_error_response(
+    message: str,
+    error_type: str = "internal_error",
+    details: Optional[Dict[str, Any]] = None,
+    status_code: int = 500
+) -> ORJSONResponse:
+    """Build the error envelope and HTTP response for endpoint except blocks.
+
+    Wraps create_error_response so handlers return a properly coded response
+    from a single call instead of each block re-assembling the envelope (and
+    previously returning it with a 200 status).
+
+    Args:
+        message: Error message
+        error_type: Type of error, also upper-cased into the error code
+        details: Additional error details
+        status_code: HTTP status code for the response
+
+    Returns:
+        ORJSONResponse carrying the standardized error payload
+    """
+    return ORJSONResponse(
+        status_code=status_code,
+        content=create_error_response(
+            code=error_type.upper(),
+            message=message,
+            error_type=error_type,
+            details=details
+        )
+    )
+
+
 def create_pagination_info(
     page: int,
     size: int,
@@ -216,13 +275,13 @@ def add_standard_headers(response: Response, request: Request) -> None:
         request: FastAPI request object
     """
     response.headers["X-API-Version"] = settings.VERSION
-    response.headers["X-Environment"] = settings.ENVIRONMENT.value
+    response.headers["X-Environment"] = _ENVIRONMENT_VALUE
     
     if hasattr(request.state, "request_id"):
         response.headers["X-Request-ID"] = request.state.request_id
     
     if hasattr(request.state, "start_time"):
-        response_time = int((time.time() - request.state.start_time) * 1000)
+        response_time = (time.perf_counter_ns() - request.state.start_time) // 1_000_000
         response.headers["X-Response-Time"] = str(response_time)
 
 
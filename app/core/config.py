@@ -188,6 +188,10 @@ class Settings:
         self.CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
         self.CACHE_MAX_MEMORY = os.getenv("CACHE_MAX_MEMORY", "256mb")
 
+        # Feature Flags
+        self.BOARDROOM_ENABLED = os.getenv("BOARDROOM_ENABLED", "true").lower() in ("true", "1", "t", "yes")
+        self.PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("true", "1", "t", "yes")
+
         # Rate Limiting Configuration
         self.RATE_LIMIT_DEFAULT = parse_list_from_env("RATE_LIMIT_DEFAULT", ["200 per day", "50 per hour"])
 
@@ -187,17 +187,18 @@ class ErrorMonitor:
         
         recent_errors = 0
         total_errors = 0
-        error_types = set()
-        
-        for error_type, timestamps in self.error_counts.items():
+
+        for timestamps in self.error_counts.values():
             total_errors += len(timestamps)
-            error_types.add(error_type)
-            
-            # Count recent errors
-            for timestamp in timestamps:
-                if timestamp >= recent_cutoff:
-                    recent_errors += 1
-        
+
+            # Timestamps are appended in order, so walk the deque from the
+            # newest end and stop at the first entry older than the cutoff
+            # instead of scanning the whole window.
+            for timestamp in reversed(timestamps):
+                if timestamp < recent_cutoff:
+                    break
+                recent_errors += 1
+
         status = "healthy"
         if recent_errors > 5:
             status = "degraded"
@@ -207,7 +208,7 @@ class ErrorMonitor:
         return {
             "status": status,
             "recent_errors_5min": recent_errors,
-            "total_error_types": len(error_types),
+            "total_error_types": len(self.error_counts),
             "monitoring_window_minutes": self.window_minutes,
             "alert_threshold": self.alert_threshold,
             "timestamp": now.isoformat()
@@ -1,7 +1,9 @@
 import asyncio
 import uuid
+from collections import Counter
 from typing import Dict, List, Any, Optional
 
+import orjson
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from langgraph.graph import StateGraph, END
@@ -11,9 +13,11 @@ from app.schemas.decision import VoteRead as VoteSchema # Using VoteRead as Vote
 from app.models.boardroom import DecisionRound, Vote as VoteORM # Renamed to avoid clash
 from app.models.database import get_db # Assuming this provides an AsyncSession
 from app.core.logging import logger
+from app.services.redis_service import redis_service
 
-# Global store for SSE queues, keyed by decision_id (string representation of UUID ID)
-decision_event_queues: Dict[str, asyncio.Queue] = {}
+# Redis Pub/Sub channel per decision (keyed by string UUID). Redis is the
+# shared bus, so SSE consumers on any worker see events published here.
+DECISION_EVENTS_CHANNEL = "decision_events:{}".format
 
 
 #region Node Implementations
@@ -184,10 +188,10 @@ async def compute_results_node(state: BoardroomGraphState) -> BoardroomGraphStat
         logger.info(f"compute_results_node: No votes found for decision_id={state.decision_id}")
         return state
 
-    tally: Dict[str, int] = {}
-    for vote_item in state.votes:
-        tally[vote_item.vote] = tally.get(vote_item.vote, 0) + 1
-    
+    # Counter's C-level update is faster than a Python-level get/add loop
+    # and is the natural fit for a frequency tally.
+    tally = dict(Counter(vote_item.vote for vote_item in state.votes))
+
     state.results = {"tally": tally}
     state.status = "results_computed"
     state.error = None
@@ -197,47 +201,38 @@ async def compute_results_node(state: BoardroomGraphState) -> BoardroomGraphStat
 
 async def notify_clients_node(state: BoardroomGraphState) -> BoardroomGraphState:
     """
-    Notifies clients about state changes via SSE queue.
+    Notifies clients about state changes via Redis Pub/Sub.
     Assumes state.decision_id is a UUID.
     """
     logger.info(f"notify_clients_node: Preparing notification for decision_id={state.decision_id}")
-    
+
     if not isinstance(state.decision_id, uuid.UUID):
         logger.error(f"notify_clients_node: decision_id is not a UUID: {state.decision_id}. Skipping notification.")
         return state # Cannot proceed without a valid UUID for keying
 
-    queue_key_str = str(state.decision_id) # Convert UUID to string for dict key and SSE payload
-
-    if queue_key_str in decision_event_queues:
-        queue = decision_event_queues[queue_key_str]
-        
-        # Prepare payload, ensuring all UUIDs are converted to strings for JSON
-        # Pydantic's model_dump(mode='json') or iterating and converting manually can work.
-        # For simplicity, converting known UUID fields to strings here.
-        
-        votes_payload = []
-        for vote in state.votes:
-            vote_dict = vote.model_dump()
-            vote_dict['id'] = str(vote.id)
-            vote_dict['round_id'] = str(vote.round_id)
-            votes_payload.append(vote_dict)
-
-        payload = {
-            "decision_id": queue_key_str,
-            "current_round_id": str(state.current_round_id) if state.current_round_id else None,
-            "votes": votes_payload, # Votes now have string UUIDs
-            "results": state.results,
-            "status": state.status,
-            "error": state.error,
-        }
-        try:
-            await queue.put(payload)
-            logger.info(f"notify_clients_node: Notification sent for decision_id={queue_key_str}, status={state.status}")
-        except Exception as e:
-            logger.error(f"notify_clients_node: Failed to put message on queue for decision_id={queue_key_str}: {e}", exc_info=True)
-    else:
-        logger.warning(f"notify_clients_node: No active SSE queue for decision_id={queue_key_str}")
-    
+    decision_id_str = str(state.decision_id) # String UUID for channel name and SSE payload
+
+    # model_dump(mode="json") converts UUIDs/datetimes to JSON-ready strings
+    # in a single pass inside pydantic-core, so no manual field conversion.
+    votes_payload = [vote.model_dump(mode="json") for vote in state.votes]
+
+    payload = {
+        "decision_id": decision_id_str,
+        "current_round_id": str(state.current_round_id) if state.current_round_id else None,
+        "votes": votes_payload, # Votes now have string UUIDs
+        "results": state.results,
+        "status": state.status,
+        "error": state.error,
+    }
+    try:
+        receivers = await redis_service.publish(
+            DECISION_EVENTS_CHANNEL(decision_id_str),
+            orjson.dumps(payload, default=str),
+        )
+        logger.info(f"notify_clients_node: Notification published for decision_id={decision_id_str}, status={state.status}, receivers={receivers}")
+    except Exception as e:
+        logger.error(f"notify_clients_node: Failed to publish event for decision_id={decision_id_str}: {e}", exc_info=True)
+
     return state
 
 
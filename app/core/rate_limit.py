@@ -0,0 +1,91 @@
+"""Redis-backed token-bucket rate limiting.
+
+slowapi's counters live per process, so multi-worker deployments undercount
+shared quotas and pay a sliding-window computation on every request. The
+dependency here enforces the quota in Redis with a single Lua script call,
+giving all workers one bucket per client and scope.
+"""
+
+import time
+from typing import Callable
+
+from fastapi import HTTPException, Request
+
+from app.core.logging import logger
+from app.services.redis_service import redis_service
+
+# Refill-on-demand token bucket. KEYS[1] is the bucket; ARGV holds capacity,
+# refill rate (tokens/second), current time (seconds) and cost. Tokens are
+# replenished proportionally to the gap since the last call, then the cost
+# is deducted if the bucket covers it. Returns {allowed, remaining}.
+TOKEN_BUCKET_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2)
+return {allowed, math.floor(tokens)}
+"""
+
+# Registered lazily so import does not require a live Redis connection; the
+# Script wrapper uses EVALSHA with an automatic EVAL fallback.
+_token_bucket_script = None
+
+
+def _get_script():
+    global _token_bucket_script
+    if _token_bucket_script is None and redis_service.client is not None:
+        _token_bucket_script = redis_service.client.register_script(TOKEN_BUCKET_SCRIPT)
+    return _token_bucket_script
+
+
+def rate_limit(scope: str, capacity: int, rate: float, cost: int = 1) -> Callable:
+    """Build a FastAPI dependency enforcing a shared token bucket.
+
+    Args:
+        scope: Logical name of the limited endpoint (part of the bucket key)
+        capacity: Maximum burst size in tokens
+        rate: Refill rate in tokens per second
+        cost: Tokens consumed per request
+
+    Returns:
+        Dependency raising HTTP 429 when the bucket is exhausted
+    """
+
+    async def dependency(request: Request) -> None:
+        script = _get_script()
+        if script is None:
+            # Redis unavailable: fail open, matching the cache fallbacks
+            return
+
+        client_ip = request.client.host if request.client else "unknown"
+        key = f"rate_limit:{scope}:{client_ip}"
+
+        try:
+            allowed, remaining = await script(
+                keys=[key],
+                args=[capacity, rate, time.time(), cost],
+            )
+        except Exception as e:
+            logger.error("rate_limit_check_failed", scope=scope, error=str(e))
+            return
+
+        if not allowed:
+            logger.warning("rate_limit_exceeded", scope=scope, client_ip=client_ip)
+            raise HTTPException(status_code=429, detail="Rate limit exceeded")
+
+    return dependency
@@ -1,6 +1,8 @@
 """This file contains the main application entry point."""
 
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import (
@@ -17,7 +19,8 @@ from fastapi import (
 )
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from langfuse import Langfuse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -55,6 +58,10 @@ async def lifespan(app: FastAPI):
         version=settings.VERSION,
         api_prefix=settings.API_V1_STR,
     )
+
+    # Record which loop implementation is actually running so a deployment
+    # that silently fell back from uvloop to asyncio is visible in the logs.
+    logger.info("event_loop_active", impl=type(asyncio.get_running_loop()).__module__)
     
     # Initialize Redis service
     try:
@@ -66,9 +73,32 @@ async def lifespan(app: FastAPI):
             error=str(e),
             message="Continuing without Redis - cache will be disabled"
         )
-    
+
+    # Warm the database engine and connection pool so the first real request
+    # doesn't pay engine creation plus connection handshake latency.
+    try:
+        await database_service.initialize()
+        logger.info("database_service_initialized")
+    except Exception as e:
+        logger.warning(
+            "database_service_initialization_failed",
+            error=str(e),
+            message="Continuing with lazy database initialization"
+        )
+
     yield
     
+    # Stop the graph job consumer before its backing services go away
+    try:
+        from app.api.v1.endpoints.decisions import shutdown_graph_worker
+        await shutdown_graph_worker()
+        logger.info("graph_worker_shutdown_completed")
+    except Exception as e:
+        logger.warning(
+            "graph_worker_shutdown_failed",
+            error=str(e)
+        )
+
     # Cleanup Redis service
     try:
         await redis_service.cleanup()
@@ -78,7 +108,17 @@ async def lifespan(app: FastAPI):
             "redis_service_cleanup_failed",
             error=str(e)
         )
-    
+
+    # Dispose database connections
+    try:
+        await database_service.close()
+        logger.info("database_service_closed")
+    except Exception as e:
+        logger.warning(
+            "database_service_close_failed",
+            error=str(e)
+        )
+
     logger.info("application_shutdown")
 
 
@@ -89,6 +129,9 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson encodes response payloads in one pass; stdlib json was the
+    # slowest link on the probe endpoints below.
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
     contact={
         "name": "Boardroom AI API Support",
@@ -148,6 +191,27 @@ app = FastAPI(
 # Set up Prometheus metrics
 setup_metrics(app)
 
+# Opt-in request profiling: with PROFILING_ENABLED set, any request carrying
+# ?profile=1 returns a pyinstrument HTML report instead of its normal
+# response. Off by default so production never pays the tracer overhead.
+if settings.PROFILING_ENABLED:
+    from fastapi.responses import HTMLResponse
+    from pyinstrument import Profiler
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if request.query_params.get("profile"):
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            await call_next(request)
+            profiler.stop()
+            return HTMLResponse(profiler.output_html())
+        return await call_next(request)
+
+# Compress larger JSON payloads (detailed health, metrics summaries) for
+# clients that send Accept-Encoding; tiny probe responses stay untouched.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Add API standards middleware first
 app.add_middleware(APIStandardsMiddleware)
 
@@ -176,7 +240,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         exc: The validation error
 
     Returns:
-        JSONResponse: A formatted error response
+        ORJSONResponse: A formatted error response
     """
     # Log the validation error (without sensitive data)
     logger.warning(
@@ -212,11 +276,11 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "message": "Request validation failed",
             "type": "validation_error",
             "details": formatted_errors,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     }
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response,
     )
@@ -247,11 +311,11 @@ async def value_error_handler(request: Request, exc: ValueError):
             "code": status.HTTP_422_UNPROCESSABLE_ENTITY,
             "message": str(exc),
             "type": "value_error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     }
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response
     )
@@ -283,11 +347,11 @@ async def internal_server_error_handler(request: Request, exc: Exception):
             "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
             "message": "Internal server error",
             "type": "server_error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     }
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response
     )
@@ -315,7 +379,7 @@ async def boardroom_exception_handler(request: Request, exc: BoardroomException)
         client_ip=request.client.host if request.client else None
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict()
     )
@@ -338,6 +402,29 @@ from app.core.openapi_customization import customize_openapi_schema
 app.openapi = lambda: customize_openapi_schema(app)
 
 
+# Settings are fixed after boot, so the host-independent part of the root
+# payload is built once; only the base_url-derived links are assembled per
+# request.
+_ROOT_STATIC_INFO = {
+    "name": settings.PROJECT_NAME,
+    "version": settings.VERSION,
+    "description": settings.DESCRIPTION,
+    "status": "operational",
+    "environment": settings.ENVIRONMENT.value,
+    "api_version": "v1",
+    "features": [
+        "JWT Authentication",
+        "AI-Powered Chat",
+        "Real-time Decision Making",
+        "Server-Sent Events",
+        "Comprehensive Monitoring",
+        "Rate Limiting",
+        "Input Validation",
+        "Error Handling"
+    ],
+}
+
+
 @app.get("/")
 @limiter.limit(settings.RATE_LIMIT_ENDPOINTS["root"][0])
 async def root(request: Request):
@@ -351,12 +438,7 @@ async def root(request: Request):
     from app.core.api_standards import APIResponseFormatter
     
     api_info = {
-        "name": settings.PROJECT_NAME,
-        "version": settings.VERSION,
-        "description": settings.DESCRIPTION,
-        "status": "operational",
-        "environment": settings.ENVIRONMENT.value,
-        "api_version": "v1",
+        **_ROOT_STATIC_INFO,
         "documentation": {
             "interactive": f"{request.base_url}docs",
             "redoc": f"{request.base_url}redoc",
@@ -370,16 +452,6 @@ async def root(request: Request):
             "events": f"{request.base_url}api/v1/events",
             "standards": f"{request.base_url}api/v1/standards"
         },
-        "features": [
-            "JWT Authentication",
-            "AI-Powered Chat",
-            "Real-time Decision Making",
-            "Server-Sent Events",
-            "Comprehensive Monitoring",
-            "Rate Limiting",
-            "Input Validation",
-            "Error Handling"
-        ],
         "support": {
             "documentation": f"{request.base_url}api/v1/standards",
             "health_check": f"{request.base_url}health",
@@ -394,6 +466,16 @@ async def root(request: Request):
     )
 
 
+# Probe endpoints are polled every few seconds by load balancers and
+# monitors; memoize the database sweep briefly so probe storms cost one
+# connectivity check instead of one per caller. The TTL stretches with probe
+# duration: a struggling database gets fewer probes, not more.
+_HEALTH_CACHE_TTL_SECONDS = 5.0
+_HEALTH_CACHE_MAX_TTL_SECONDS = 30.0
+_health_cached_db_ok: bool = False
+_health_cache_expires = 0.0
+
+
 @app.get("/health")
 @limiter.limit(settings.RATE_LIMIT_ENDPOINTS["health"][0])
 async def health_check(request: Request) -> Dict[str, Any]:
@@ -402,12 +484,22 @@ async def health_check(request: Request) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Health status information using standardized response format
     """
+    global _health_cached_db_ok, _health_cache_expires
+
     logger.info("health_check_called")
     
     from app.core.api_standards import APIResponseFormatter
 
-    # Check database connectivity
-    db_healthy = await database_service.health_check()
+    # Check database connectivity (memoized across probe bursts)
+    if time.monotonic() < _health_cache_expires:
+        db_healthy = _health_cached_db_ok
+    else:
+        probe_start = time.monotonic()
+        db_healthy = await database_service.health_check()
+        probe_duration = time.monotonic() - probe_start
+        ttl = min(_HEALTH_CACHE_MAX_TTL_SECONDS, max(_HEALTH_CACHE_TTL_SECONDS, probe_duration * 5))
+        _health_cached_db_ok = db_healthy
+        _health_cache_expires = time.monotonic() + ttl
 
     health_data = {
         "status": "healthy" if db_healthy else "degraded",
@@ -420,7 +512,7 @@ async def health_check(request: Request) -> Dict[str, Any]:
             "rate_limiter": "healthy",
             "monitoring": "healthy"
         },
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "checks": {
             "database_connectivity": "pass" if db_healthy else "fail",
             "api_availability": "pass",
@@ -439,7 +531,7 @@ async def health_check(request: Request) -> Dict[str, Any]:
     # If DB is unhealthy, set the appropriate status code
     status_code = status.HTTP_200_OK if db_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
-    return JSONResponse(content=response_data, status_code=status_code)
+    return ORJSONResponse(content=response_data, status_code=status_code)
 
 
 @app.get("/monitoring/errors")
@@ -454,19 +546,20 @@ async def error_monitoring_status(request: Request) -> Dict[str, Any]:
     
     from app.core.error_monitoring import get_monitoring_health, get_error_summary
     
-    # Get monitoring health status
+    # Both helpers read in-process error metrics only (no I/O), so calling
+    # them synchronously inside this async handler cannot block the loop.
     health_status = get_monitoring_health()
-    
-    # Get error summary for last 24 hours
     error_summary = get_error_summary(hours=24)
     
-    # Convert ErrorMetric objects to dictionaries for JSON response
+    # Convert ErrorMetric objects to dictionaries for the JSON response.
+    # Raw datetimes are passed through: orjson renders them to ISO-8601 in
+    # native code, so the per-metric isoformat() allocations are gone.
     summary_dict = {}
     for error_type, metric in error_summary.items():
         summary_dict[error_type] = {
             "count": metric.count,
-            "last_occurrence": metric.last_occurrence.isoformat(),
-            "first_occurrence": metric.first_occurrence.isoformat(),
+            "last_occurrence": metric.last_occurrence,
+            "first_occurrence": metric.first_occurrence,
             "paths": metric.paths[:10],  # Limit to first 10 paths
             "status_codes": list(set(metric.status_codes))
         }
@@ -474,7 +567,7 @@ async def error_monitoring_status(request: Request) -> Dict[str, Any]:
     response = {
         "monitoring_health": health_status,
         "error_summary_24h": summary_dict,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     }
     
-    return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+    return ORJSONResponse(content=response, status_code=status.HTTP_200_OK)
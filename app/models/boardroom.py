@@ -2,12 +2,19 @@
 
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Dict,
     List,
     Optional,
 )
 import uuid
-from datetime import datetime
+from datetime import datetime, UTC
 
+from sqlalchemy import (
+    JSON,
+    Column,
+    Index,
+)
 from sqlmodel import (
     Field,
     Relationship,
@@ -46,4 +53,92 @@ class Boardroom(BaseModel, table=True):
     
     # Relationships
     owner: "User" = Relationship(back_populates="owned_boardrooms")
-    sessions: List["Session"] = Relationship(back_populates="boardroom")
\ No newline at end of file
+    sessions: List["Session"] = Relationship(back_populates="boardroom")
+
+class Decision(BaseModel, table=True):
+    """Decision model for storing boardroom decisions.
+
+    Attributes:
+        id: The primary key (UUID)
+        title: Title of the decision
+        description: Description of the decision
+        overall_status: Overall status of the decision
+        created_at: When the decision was created (inherited from BaseModel)
+        rounds: Relationship to the decision's voting rounds
+    """
+
+    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    title: str = Field(max_length=200)
+    description: Optional[str] = Field(default=None)
+    overall_status: str = Field(default="pending", max_length=50)
+
+    # Relationships
+    rounds: List["DecisionRound"] = Relationship(back_populates="decision")
+
+
+class DecisionRound(BaseModel, table=True):
+    """Decision round model for storing voting rounds of a decision.
+
+    Attributes:
+        id: The primary key (UUID)
+        decision_id: Foreign key to the decision
+        round_number: Sequence number of the round
+        title: Title of the round
+        description: Description of the round
+        options: Voting options as JSON
+        option_keys: Normalized list of valid option keys
+        opens_at: When voting opens
+        closes_at: When voting closes
+        round_status: Status of the round
+        created_at: When the round was created (inherited from BaseModel)
+        decision: Relationship to the parent decision
+        votes: Relationship to the votes cast in this round
+    """
+
+    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    decision_id: uuid.UUID = Field(foreign_key="decision.id", index=True)
+    round_number: int = Field(default=1)
+    title: Optional[str] = Field(default=None, max_length=200)
+    description: Optional[str] = Field(default=None)
+    options: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    # Option keys are normalized once at write time so the vote hot path
+    # reads a flat list instead of re-deriving keys from the options shape.
+    option_keys: Optional[List[str]] = Field(default=None, sa_column=Column(JSON))
+    opens_at: datetime
+    closes_at: Optional[datetime] = Field(default=None)
+    round_status: str = Field(default="open", max_length=50)
+
+    # Relationships
+    decision: "Decision" = Relationship(back_populates="rounds")
+    votes: List["Vote"] = Relationship(back_populates="round")
+
+
+class Vote(BaseModel, table=True):
+    """Vote model for storing votes cast in a decision round.
+
+    Attributes:
+        id: The primary key (UUID)
+        decision_round_id: Foreign key to the decision round
+        voter_ip: IP address of the voter
+        selected_option_key: Key of the selected option
+        voted_at: When the vote was cast
+        rationale: Optional reasoning behind the vote
+        created_at: When the vote record was created (inherited from BaseModel)
+        round: Relationship to the decision round
+    """
+
+    __table_args__ = (
+        # One vote per voter per round, enforced at the database layer and
+        # used by the submit_vote idempotency lookup.
+        Index("ix_vote_round_voter", "decision_round_id", "voter_ip", unique=True),
+    )
+
+    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    decision_round_id: uuid.UUID = Field(foreign_key="decisionround.id", index=True)
+    voter_ip: str = Field(max_length=45)
+    selected_option_key: str = Field(max_length=50)
+    voted_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    rationale: Optional[str] = Field(default=None, max_length=1000)
+
+    # Relationships
+    round: "DecisionRound" = Relationship(back_populates="votes")
@@ -1,5 +1,21 @@
 """Database models for the application."""
 
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.models.thread import Thread
+from app.services.database import database_service
+
+__all__ = ["Thread", "get_db"]
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields an async database session.
 
-__all__ = ["Thread"]
+    Yields:
+        AsyncSession: A session bound to the shared async engine, closed
+            automatically when the request completes.
+    """
+    async with database_service.get_session() as session:
+        yield session
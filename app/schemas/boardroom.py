@@ -3,7 +3,7 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 # Base Schemas for DB models (for reading/returning from API)
@@ -15,8 +15,7 @@ class Vote(BaseModel):
     voted_at: datetime
     rationale: Optional[str] = Field(None, max_length=1000, description="Vote reasoning")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @field_validator("voter_ip")
     @classmethod
@@ -67,8 +66,7 @@ class DecisionRound(BaseModel):
     created_at: datetime
     votes: List[Vote] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @field_validator("title")
     @classmethod
@@ -138,8 +136,7 @@ class Decision(BaseModel):
     overall_status: str = Field(..., description="Overall decision status")
     rounds: List[DecisionRound] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @field_validator("title")
     @classmethod
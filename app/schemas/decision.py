@@ -1,7 +1,7 @@
 import uuid
 import re
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import Optional
 
 class DecisionBase(BaseModel):
@@ -52,8 +52,7 @@ class DecisionRead(DecisionBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class DecisionRoundBase(BaseModel):
     decision_id: uuid.UUID
@@ -80,8 +79,7 @@ class DecisionRoundRead(DecisionRoundBase):
     id: uuid.UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class VoteBase(BaseModel):
     round_id: uuid.UUID
@@ -134,5 +132,4 @@ class VoteRead(VoteBase):
     id: uuid.UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
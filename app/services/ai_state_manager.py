@@ -1,5 +1,6 @@
 """AI State Management Service for LangGraph integration."""
 
+import asyncio
 import json
 import uuid
 from datetime import datetime, timedelta
@@ -13,12 +14,16 @@ from app.core.logging import logger
 from app.core.metrics import ai_state_operations_total
 from app.core.exceptions import raise_state_management_error
 from app.schemas.ai_operations import ConversationState, AIOperationStatus
-from app.services.database import get_db
+from app.models.database import get_db
 
 
 class AIStateManager:
     """Manages AI conversation states with persistence and recovery capabilities."""
-    
+
+    # How many expired states to clear before yielding control back to the
+    # event loop during cleanup.
+    CLEANUP_BATCH_SIZE = 500
+
     def __init__(self):
         """Initialize the state manager."""
         self._active_states: Dict[str, ConversationState] = {}
@@ -265,16 +270,21 @@ class AIStateManager:
         try:
             cutoff_time = datetime.now() - timedelta(hours=expiry_hours)
             cleaned_count = 0
-            
-            expired_sessions = []
-            for session_id, state in self._active_states.items():
-                if state.updated_at < cutoff_time:
-                    expired_sessions.append(session_id)
-            
+
+            expired_sessions = [
+                session_id
+                for session_id, state in self._active_states.items()
+                if state.updated_at < cutoff_time
+            ]
+
             for session_id in expired_sessions:
                 await self.clear_conversation_state(session_id)
                 cleaned_count += 1
-            
+                # Yield to the event loop between batches so a large cleanup
+                # doesn't starve concurrent requests.
+                if cleaned_count % self.CLEANUP_BATCH_SIZE == 0:
+                    await asyncio.sleep(0)
+
             logger.info("expired_states_cleaned", count=cleaned_count, expiry_hours=expiry_hours)
             return cleaned_count
             
@@ -24,7 +24,11 @@ from app.core.exceptions import ExternalServiceException
 
 class CacheStats:
     """Cache statistics tracking."""
-    
+
+    # Fixed attribute set; slots keep the per-instance footprint flat and
+    # attribute access cheap on the counters bumped for every cache call.
+    __slots__ = ("hits", "misses", "sets", "deletes", "errors", "start_time")
+
     def __init__(self):
         self.hits = 0
         self.misses = 0
@@ -52,7 +56,9 @@ class CacheStats:
     def hit_rate(self) -> float:
         """Calculate cache hit rate."""
         total = self.hits + self.misses
-        return self.hits / total if total > 0 else 0.0
+        # `or 1` keeps the zero-operations case divide-safe without a branch;
+        # 0 / 1 still reports a 0.0 hit rate
+        return self.hits / (total or 1)
         
     @property
     def total_operations(self) -> int:
@@ -84,6 +90,9 @@ class RedisService:
         self.health_status = "unknown"
         self.last_health_check = 0
         self.connection_errors = deque(maxlen=100)  # Track recent errors
+        self._health_check_payload: Optional[Dict[str, Any]] = None
+        self._health_check_expires = 0.0
+        self._health_check_inflight: Optional[asyncio.Future] = None
         
         # TTL defaults for different data types
         self.default_ttl = {
@@ -128,18 +137,50 @@ class RedisService:
             logger.error("redis_initialization_failed", error=str(e), exc_info=True)
             return False
     
+    # Memoization window for health probes; keeps aggressive external
+    # polling from translating into per-request Redis round trips.
+    HEALTH_CHECK_TTL_SECONDS = 1.0
+
     async def health_check(self) -> Dict[str, Any]:
-        """Perform Redis health check."""
+        """Perform Redis health check.
+
+        Results are memoized for a short TTL and concurrent callers share a
+        single in-flight probe, so burst polling from liveness/readiness
+        checks collapses to one Redis round trip per second.
+        """
+        if self._health_check_payload is not None and time.monotonic() < self._health_check_expires:
+            return self._health_check_payload
+
+        inflight = self._health_check_inflight
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Distinguish this caller being cancelled from the owning
+                # probe being cancelled out from under the shared future.
+                if not inflight.cancelled():
+                    raise
+                return await self.health_check()
+
+        inflight = asyncio.get_running_loop().create_future()
+        self._health_check_inflight = inflight
+        try:
+            payload = await self._run_health_check()
+            self._health_check_payload = payload
+            self._health_check_expires = time.monotonic() + self.HEALTH_CHECK_TTL_SECONDS
+            inflight.set_result(payload)
+            return payload
+        finally:
+            # If the probe was cancelled (or raised) before the future was
+            # completed, cancel it so concurrent waiters are released to
+            # retry instead of hanging on a future nobody will finish.
+            if not inflight.done():
+                inflight.cancel()
+            self._health_check_inflight = None
+
+    async def _run_health_check(self) -> Dict[str, Any]:
+        """Probe Redis and assemble the health payload."""
         now = time.time()
-        
-        # Only check every 30 seconds to avoid overhead
-        if now - self.last_health_check < 30:
-            return {
-                "status": self.health_status,
-                "last_check": self.last_health_check,
-                "cached_result": True
-            }
-        
         try:
             if not self.client:
                 await self.initialize()
@@ -242,7 +283,30 @@ class RedisService:
             logger.error("redis_get_failed", key=key, error=str(e))
             return None
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None, 
+    async def mget(self, keys: List[str]) -> List[Any]:
+        """Get multiple keys in one MGET round trip (None for misses)."""
+        if not keys or not self.client or self.health_status == "unhealthy":
+            self.stats.misses += len(keys)
+            return [None] * len(keys)
+
+        try:
+            raw_values = await self.client.mget(keys)
+            values = []
+            for raw in raw_values:
+                if raw is None:
+                    self.stats.miss()
+                    values.append(None)
+                else:
+                    self.stats.hit()
+                    values.append(self._deserialize_value(raw))
+            return values
+
+        except Exception as e:
+            self.stats.error()
+            logger.error("redis_mget_failed", key_count=len(keys), error=str(e))
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None,
                   cache_type: str = "default") -> bool:
         """Set value in cache with TTL."""
         if not self.client or self.health_status == "unhealthy":
@@ -289,24 +353,100 @@ class RedisService:
             logger.error("redis_exists_failed", key=key, error=str(e))
             return False
     
+    async def set_many(self, items: List[tuple], cache_type: str = "default") -> bool:
+        """Set multiple (key, value, ttl) entries in one pipelined round trip.
+
+        A ttl of None falls back to the cache-type default, matching set().
+        """
+        if not items or not self.client or self.health_status == "unhealthy":
+            return False
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value, ttl in items:
+                    if ttl is None:
+                        ttl = self.default_ttl.get(cache_type, 300)
+                    pipe.set(key, self._serialize_value(value), ex=ttl)
+                await pipe.execute()
+
+            self.stats.sets += len(items)
+            return True
+
+        except Exception as e:
+            self.stats.error()
+            logger.error("redis_set_many_failed", key_count=len(items), error=str(e))
+            return False
+
+    # How many keys to accumulate before issuing an UNLINK during pattern
+    # invalidation.
+    INVALIDATE_BATCH_SIZE = 500
+
     async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching pattern."""
+        """Invalidate all keys matching pattern.
+
+        Uses SCAN instead of KEYS so Redis never blocks on a full keyspace
+        sweep, and UNLINKs matches in batches so the actual memory frees
+        happen off the server's main thread.
+        """
         if not self.client or self.health_status == "unhealthy":
             return 0
-        
+
         try:
-            keys = await self.client.keys(pattern)
-            if keys:
-                deleted = await self.client.delete(*keys)
-                self.stats.deletes += deleted
-                return deleted
-            return 0
-            
+            deleted = 0
+            batch = []
+            async for key in self.client.scan_iter(match=pattern, count=self.INVALIDATE_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.INVALIDATE_BATCH_SIZE:
+                    deleted += await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.client.unlink(*batch)
+
+            self.stats.deletes += deleted
+            return deleted
+
         except Exception as e:
             self.stats.error()
             logger.error("redis_invalidate_pattern_failed", pattern=pattern, error=str(e))
             return 0
     
+    async def test_operations(self, key: str, value: Any, ttl: int = 60) -> Optional[Dict[str, Any]]:
+        """Run a set/get/exists/delete diagnostic in one MULTI/EXEC round trip.
+
+        Returns per-operation results plus the wall time of the single
+        execute() call, or None when the client is unavailable.
+        """
+        if not self.client or self.health_status == "unhealthy":
+            return None
+
+        try:
+            data = self._serialize_value(value)
+
+            start = time.perf_counter()
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.set(key, data, ex=ttl)
+                pipe.get(key)
+                pipe.exists(key)
+                pipe.delete(key)
+                set_ok, raw, exists_count, deleted = await pipe.execute()
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            return {
+                "set": {"success": bool(set_ok)},
+                "get": {
+                    "success": raw is not None,
+                    "data_matches": raw is not None and self._deserialize_value(raw) == value,
+                },
+                "exists": {"success": exists_count > 0},
+                "delete": {"success": deleted > 0},
+                "total_duration_ms": duration_ms,
+            }
+
+        except Exception as e:
+            self.stats.error()
+            logger.error("redis_test_operations_failed", key=key, error=str(e))
+            return None
+
     async def get_ttl(self, key: str) -> int:
         """Get TTL for key (-1 if no expiry, -2 if key doesn't exist)."""
         if not self.client:
@@ -318,6 +458,28 @@ class RedisService:
             logger.error("redis_ttl_failed", key=key, error=str(e))
             return -2
     
+    def pubsub(self):
+        """Create a Pub/Sub interface on the underlying client.
+
+        Returns None when the client is unavailable so callers can degrade
+        gracefully.
+        """
+        if not self.client:
+            return None
+        return self.client.pubsub()
+
+    async def publish(self, channel: str, message: Union[bytes, str]) -> int:
+        """Publish a message to a channel; returns the receiver count."""
+        if not self.client or self.health_status == "unhealthy":
+            return 0
+
+        try:
+            return await self.client.publish(channel, message)
+        except Exception as e:
+            self.stats.error()
+            logger.error("redis_publish_failed", channel=channel, error=str(e))
+            return 0
+
     # Cache decorator methods
     def cache_result(self, cache_type: str = "default", ttl: Optional[int] = None):
         """Decorator to cache function results."""
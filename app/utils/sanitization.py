@@ -10,6 +10,19 @@ from typing import (
     Union,
 )
 
+# Patterns compiled once at import time so hot call sites skip the re-module
+# cache lookup on every invocation.
+_ESCAPED_SCRIPT_PATTERN = re.compile(r"&lt;script.*?&gt;.*?&lt;/script&gt;", re.DOTALL)
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PASSWORD_UPPER_PATTERN = re.compile(r"[A-Z]")
+_PASSWORD_LOWER_PATTERN = re.compile(r"[a-z]")
+_PASSWORD_DIGIT_PATTERN = re.compile(r"[0-9]")
+_PASSWORD_SPECIAL_PATTERN = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_FILENAME_UNSAFE_PATTERN = re.compile(r'[<>:"/\\|?*]')
+_PATH_TRAVERSAL_UNIX_PATTERN = re.compile(r'\.\./')
+_PATH_TRAVERSAL_WINDOWS_PATTERN = re.compile(r'\.\.\\')
+_HEADER_NEWLINE_PATTERN = re.compile(r'[\r\n]')
+
 
 def sanitize_string(value: str) -> str:
     """Sanitize a string to prevent XSS and other injection attacks.
@@ -28,7 +41,7 @@ def sanitize_string(value: str) -> str:
     value = html.escape(value)
 
     # Remove any script tags that might have been escaped
-    value = re.sub(r"&lt;script.*?&gt;.*?&lt;/script&gt;", "", value, flags=re.DOTALL)
+    value = _ESCAPED_SCRIPT_PATTERN.sub("", value)
 
     # Remove null bytes
     value = value.replace("\0", "")
@@ -49,7 +62,7 @@ def sanitize_email(email: str) -> str:
     email = sanitize_string(email)
 
     # Ensure email format (simple check)
-    if not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", email):
+    if not _EMAIL_PATTERN.match(email):
         raise ValueError("Invalid email format")
 
     return email.lower()
@@ -114,16 +127,16 @@ def validate_password_strength(password: str) -> bool:
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters long")
 
-    if not re.search(r"[A-Z]", password):
+    if not _PASSWORD_UPPER_PATTERN.search(password):
         raise ValueError("Password must contain at least one uppercase letter")
 
-    if not re.search(r"[a-z]", password):
+    if not _PASSWORD_LOWER_PATTERN.search(password):
         raise ValueError("Password must contain at least one lowercase letter")
 
-    if not re.search(r"[0-9]", password):
+    if not _PASSWORD_DIGIT_PATTERN.search(password):
         raise ValueError("Password must contain at least one number")
 
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not _PASSWORD_SPECIAL_PATTERN.search(password):
         raise ValueError("Password must contain at least one special character")
 
     return True
@@ -139,11 +152,11 @@ def sanitize_filename(filename: str) -> str:
         str: The sanitized filename
     """
     # Remove path separators and dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = _FILENAME_UNSAFE_PATTERN.sub('', filename)
     
     # Remove path traversal attempts
-    filename = re.sub(r'\.\./', '', filename)
-    filename = re.sub(r'\.\.\\', '', filename)
+    filename = _PATH_TRAVERSAL_UNIX_PATTERN.sub('', filename)
+    filename = _PATH_TRAVERSAL_WINDOWS_PATTERN.sub('', filename)
     
     # Remove null bytes
     filename = filename.replace('\0', '')
@@ -334,7 +347,7 @@ def sanitize_header_value(value: str) -> str:
         str: The sanitized header value
     """
     # Remove newlines to prevent header injection
-    value = re.sub(r'[\r\n]', '', value)
+    value = _HEADER_NEWLINE_PATTERN.sub('', value)
     
     # Remove null bytes
     value = value.replace('\0', '')
@@ -0,0 +1,113 @@
+"""Unit tests for the vote submission path in app.api.v1.boardroom.
+
+Exercises the single-statement INSERT ... ON CONFLICT duplicate handling
+(201 on a fresh vote, 409 on a repeat voter) with mocked database and
+cache layers.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.boardroom import submit_vote
+from app.core.limiter import limiter
+from app.schemas.boardroom import VoteCreate
+
+VALID_OPTIONS = ["approve", "reject"]
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limiter():
+    """Call the endpoint as a plain coroutine, outside a real request cycle."""
+    limiter.enabled = False
+    yield
+    limiter.enabled = True
+
+
+def make_request(host="203.0.113.9"):
+    request = Mock()
+    request.client.host = host
+    return request
+
+
+def make_db(returned_vote_id):
+    """Mock session whose VOTE_INSERT_STMT execution yields the given id."""
+    db = AsyncMock()
+    result = Mock()
+    result.scalar.return_value = returned_vote_id
+    db.execute.return_value = result
+    return db
+
+
+@pytest.mark.unit
+class TestSubmitVote:
+    """Test submit_vote duplicate detection and validation."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_vote_is_recorded(self):
+        """A returned id from the INSERT means the vote was new: 201 body."""
+        vote_id = uuid.uuid4()
+        db = make_db(vote_id)
+
+        with patch("app.api.v1.boardroom.redis_service.get", new=AsyncMock(return_value=VALID_OPTIONS)):
+            response = await submit_vote(
+                request=make_request(),
+                round_id=uuid.uuid4(),
+                vote_in=VoteCreate(selected_option_key="approve"),
+                db=db,
+            )
+
+        assert response == {"status": "vote recorded", "vote_id": str(vote_id)}
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_vote_returns_409(self):
+        """ON CONFLICT DO NOTHING returns no id for a repeat voter: 409."""
+        db = make_db(None)
+
+        with patch("app.api.v1.boardroom.redis_service.get", new=AsyncMock(return_value=VALID_OPTIONS)):
+            with pytest.raises(HTTPException) as exc_info:
+                await submit_vote(
+                    request=make_request(),
+                    round_id=uuid.uuid4(),
+                    vote_in=VoteCreate(selected_option_key="approve"),
+                    db=db,
+                )
+
+        assert exc_info.value.status_code == 409
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_option_returns_400(self):
+        """An option key outside the round's cached set is rejected."""
+        db = make_db(uuid.uuid4())
+
+        with patch("app.api.v1.boardroom.redis_service.get", new=AsyncMock(return_value=VALID_OPTIONS)):
+            with pytest.raises(HTTPException) as exc_info:
+                await submit_vote(
+                    request=make_request(),
+                    round_id=uuid.uuid4(),
+                    vote_in=VoteCreate(selected_option_key="abstain"),
+                    db=db,
+                )
+
+        assert exc_info.value.status_code == 400
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_voter_ip_is_normalized(self):
+        """The client address is compressed before it reaches the INSERT."""
+        db = make_db(uuid.uuid4())
+
+        with patch("app.api.v1.boardroom.redis_service.get", new=AsyncMock(return_value=VALID_OPTIONS)):
+            await submit_vote(
+                request=make_request(host="2001:0db8:0000:0000:0000:0000:0000:0001"),
+                round_id=uuid.uuid4(),
+                vote_in=VoteCreate(selected_option_key="approve"),
+                db=db,
+            )
+
+        params = db.execute.await_args.args[1]
+        assert params["voter_ip"] == "2001:db8::1"
@@ -0,0 +1,111 @@
+"""Unit tests for the Redis token-bucket rate limit dependency.
+
+Covers the allow, deny and fail-open paths of app.core.rate_limit
+without requiring a live Redis connection.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException
+
+from app.core.rate_limit import rate_limit
+
+
+class FakeScript:
+    """Stands in for the registered Lua script; records the call it receives."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.keys = None
+        self.args = None
+
+    async def __call__(self, keys, args):
+        self.keys = keys
+        self.args = args
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def make_request(host="203.0.113.9"):
+    """Build a minimal request double exposing the client address."""
+    request = Mock()
+    if host is None:
+        request.client = None
+    else:
+        request.client.host = host
+    return request
+
+
+@pytest.mark.unit
+class TestRateLimitDependency:
+    """Test the dependency built by rate_limit()."""
+
+    @pytest.mark.asyncio
+    async def test_allows_request_when_bucket_has_tokens(self):
+        """A [1, remaining] script result lets the request through."""
+        script = FakeScript(result=[1, 4])
+        dependency = rate_limit("test_scope", capacity=5, rate=1.0)
+
+        with patch("app.core.rate_limit._get_script", return_value=script):
+            await dependency(make_request())
+
+        assert script.keys == ["rate_limit:test_scope:203.0.113.9"]
+        capacity, rate, _now, cost = script.args
+        assert capacity == 5
+        assert rate == 1.0
+        assert cost == 1
+
+    @pytest.mark.asyncio
+    async def test_denies_request_when_bucket_is_exhausted(self):
+        """A [0, 0] script result raises HTTP 429."""
+        script = FakeScript(result=[0, 0])
+        dependency = rate_limit("test_scope", capacity=5, rate=1.0)
+
+        with patch("app.core.rate_limit._get_script", return_value=script):
+            with pytest.raises(HTTPException) as exc_info:
+                await dependency(make_request())
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_cost_is_forwarded_to_the_script(self):
+        """A custom per-request cost reaches the Lua script."""
+        script = FakeScript(result=[1, 2])
+        dependency = rate_limit("test_scope", capacity=10, rate=2.0, cost=3)
+
+        with patch("app.core.rate_limit._get_script", return_value=script):
+            await dependency(make_request())
+
+        assert script.args[3] == 3
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_is_unavailable(self):
+        """No registered script (Redis down at import) means no limiting."""
+        dependency = rate_limit("test_scope", capacity=5, rate=1.0)
+
+        with patch("app.core.rate_limit._get_script", return_value=None):
+            # Must not raise; the request proceeds unlimited
+            await dependency(make_request())
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_script_call_raises(self):
+        """A Redis error mid-request is logged and the request proceeds."""
+        script = FakeScript(error=ConnectionError("redis gone"))
+        dependency = rate_limit("test_scope", capacity=5, rate=1.0)
+
+        with patch("app.core.rate_limit._get_script", return_value=script):
+            await dependency(make_request())
+
+    @pytest.mark.asyncio
+    async def test_missing_client_falls_back_to_unknown_bucket(self):
+        """Requests without a client address share the 'unknown' bucket."""
+        script = FakeScript(result=[1, 4])
+        dependency = rate_limit("test_scope", capacity=5, rate=1.0)
+
+        with patch("app.core.rate_limit._get_script", return_value=script):
+            await dependency(make_request(host=None))
+
+        assert script.keys == ["rate_limit:test_scope:unknown"]